@@ -4,7 +4,7 @@ Streamlit FRED Explorer
 Quick start:
 1) Save this file as app.py
 2) Create a virtual env and install deps:
-   pip install streamlit fredapi plotly pandas python-dateutil requests
+   pip install streamlit fredapi plotly pandas pyarrow python-dateutil "httpx[http2]"
 3) Set your FRED API key (https://fred.stlouisfed.org/docs/api/api_key.html):
    macOS/Linux: export FRED_API_KEY=your_key_here
    Windows (Powershell): setx FRED_API_KEY your_key_here
@@ -16,24 +16,39 @@ Notes:
 - Data source: Federal Reserve Economic Data (FRED)
 """
 
+import gzip
+import hashlib
+import importlib.util
+import io
+import json
 import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import List, Dict
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Tuple
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import streamlit as st
 from dateutil.relativedelta import relativedelta
-import requests
 
-try:
+if TYPE_CHECKING:
+    import httpx
     from fredapi import Fred
-except Exception:
-    Fred = None
+
+# plotly.express, fredapi and httpx are imported where they are used to keep cold start light
+FREDAPI_AVAILABLE = importlib.util.find_spec("fredapi") is not None
 
 APP_TITLE = "FRED Data Explorer"
 DEFAULT_START = date.today() - relativedelta(years=10)
 DEFAULT_END = date.today()
+HTTP_TIMEOUT = 20
+MAX_PLOT_POINTS = 2000  # per series; keeps chart payload roughly O(pixels)
+GZIP_THRESHOLD_BYTES = 1_000_000  # larger CSV exports are offered gzipped
+SERIES_CACHE_DIR = Path("~/.cache/fred").expanduser()
+SERIES_CACHE_TTL = 86400  # seconds; FRED series rarely change intraday
 
 UNITS = {
     "lin": "Index (no transformation)",
@@ -66,12 +81,37 @@ AGGREGATIONS = {
 
 # -------------- Helpers -------------- #
 @st.cache_resource(show_spinner=False)
+def _fred_clients() -> Dict[str, "Fred"]:
+    # Module globals are rebuilt on every script rerun, so the registry lives in cache_resource
+    return {}
+
+def api_key_fingerprint(api_key: str) -> str:
+    return hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest()
+
 def get_fred(api_key: str):
     if not api_key:
         raise RuntimeError("Missing FRED API key. Set FRED_API_KEY env var.")
-    return Fred(api_key=api_key)
+    clients = _fred_clients()
+    fp = api_key_fingerprint(api_key)
+    client = clients.get(fp)
+    if client is None:
+        from fredapi import Fred
+        client = clients[fp] = Fred(api_key=api_key)
+    return client
 
-@st.cache_data(show_spinner=False)
+@st.cache_resource(show_spinner=False)
+def get_http() -> "httpx.Client":
+    # One shared HTTP/2 client so REST calls multiplex over a kept-alive connection across reruns
+    import httpx
+
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=16),
+    )
+    return httpx.Client(transport=transport, timeout=HTTP_TIMEOUT)
+
+@st.cache_data(show_spinner=False, ttl=900)
 def fred_search(_fred: "Fred", api_key: str, query: str, limit: int = 50) -> pd.DataFrame:
     if not query.strip():
         return pd.DataFrame()
@@ -92,7 +132,7 @@ def fred_search(_fred: "Fred", api_key: str, query: str, limit: int = 50) -> pd.
             "order_by": "popularity",
             "sort_order": "desc",
         }
-        resp = requests.get("https://api.stlouisfed.org/fred/series/search", params=params, timeout=20)
+        resp = get_http().get("https://api.stlouisfed.org/fred/series/search", params=params)
         resp.raise_for_status()
         payload = resp.json()
         rows = payload.get("seriess", [])
@@ -108,40 +148,175 @@ def fred_search(_fred: "Fred", api_key: str, query: str, limit: int = 50) -> pd.
         "observation_end",
         "popularity",
     ]
-    out = df[keep_cols].copy()
+    # reindex tolerates columns missing from either search path and already returns a new frame
+    out = df.reindex(columns=keep_cols)
     # Convert problematic date-like columns to strings
     for col in ("observation_start", "observation_end"):
         if col in out.columns:
-            out[col] = out[col].astype(str)
+            if pd.api.types.is_datetime64_any_dtype(out[col]):
+                out[col] = out[col].dt.strftime("%Y-%m-%d").fillna("")
+            else:
+                # Leave string dates as-is; parsing would drop ones outside the Timestamp range
+                out[col] = out[col].astype(str)
+    # Arrow-backed dtypes let st.dataframe skip object-column conversion on every rerun
+    out["popularity"] = pd.to_numeric(out["popularity"], errors="coerce")
+    out = out.astype({
+        "popularity": "Int32",
+        "id": "string[pyarrow]",
+        "title": "string[pyarrow]",
+        "frequency": "string[pyarrow]",
+        "units": "string[pyarrow]",
+        "seasonal_adjustment": "string[pyarrow]",
+    })
     return out.reset_index(drop=True)
 
-@st.cache_data(show_spinner=False)
+def _prune_series_cache() -> None:
+    # Window-keyed files pile up daily, so drop anything past the TTL whenever we miss
+    cutoff = time.time() - SERIES_CACHE_TTL
+    for path in SERIES_CACHE_DIR.glob("*.parquet*"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+def _cached_get(fred: "Fred", sid: str, **params) -> pd.Series:
+    # Pulls are cached on disk per (series, window, transform) so they survive restarts
+    # sid is raw user input, so it only reaches the filename through the hash
+    key = json.dumps({"sid": sid, **params}, sort_keys=True, default=str)
+    path = SERIES_CACHE_DIR / f"{hashlib.md5(key.encode()).hexdigest()}.parquet"
+    try:
+        if time.time() - path.stat().st_mtime < SERIES_CACHE_TTL:
+            return pd.read_parquet(path).iloc[:, 0]
+    except Exception:
+        pass  # missing or unreadable file: treat as a cache miss
+    _prune_series_cache()
+    s = fred.get_series(sid, **params)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".parquet.tmp")
+        os.close(fd)
+        try:
+            s.to_frame(sid).to_parquet(tmp)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    except Exception:
+        pass  # the data is already downloaded; a failed cache write must not fail the fetch
+    return s
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=64)
 def fetch_series(
     _fred: "Fred",
-    series_ids: List[str],
+    series_ids: Tuple[str, ...],
     start: date,
     end: date,
     units: str,
     frequency: str,
     aggregation_method: str,
 ) -> pd.DataFrame:
-    frames = []
-    for sid in series_ids:
-        s = _fred.get_series(
-            sid,
-            observation_start=start,
-            observation_end=end,
-            units=units or None,
-            frequency=frequency or None,
-            aggregation_method=aggregation_method or None,
-        )
-        frames.append(s.rename(sid).to_frame())
-    if not frames:
+    if not series_ids:
         return pd.DataFrame()
-    df = pd.concat(frames, axis=1)
+    # Requests are I/O-bound, so fan them out; columns follow series_ids order
+    with ThreadPoolExecutor(max_workers=min(8, len(series_ids))) as ex:
+        futures = {
+            sid: ex.submit(
+                _cached_get,
+                _fred,
+                sid,
+                observation_start=start,
+                observation_end=end,
+                units=units or None,
+                frequency=frequency or None,
+                aggregation_method=aggregation_method or None,
+            )
+            for sid in series_ids
+        }
+        results = {sid: fut.result() for sid, fut in futures.items()}
+    series_list = [results[sid].rename(sid) for sid in series_ids]
+    if len(series_list) == 1:
+        # Common single-series case: no alignment needed, so skip concat
+        df = series_list[0].to_frame()
+    else:
+        df = pd.concat(series_list, axis=1)
     df.index.name = "Date"
     return df
 
+@st.cache_data(show_spinner=False, ttl=86400)
+def get_series_title(_fred: "Fred", sid: str) -> str:
+    # Errors propagate so Streamlit does not cache a fallback; callers fall back to the ID
+    return _fred.get_series_info(sid).title
+
+def downsample_for_plot(df: pd.DataFrame, n_out: int = MAX_PLOT_POINTS) -> pd.DataFrame:
+    """Min/max bucket downsampling so peaks survive while the chart stays light."""
+    if len(df) <= n_out:
+        return df
+    keep = set()
+    n_buckets = max(n_out // 2, 1)
+    for col in df.columns:
+        values = df[col].to_numpy(dtype=float)
+        pos = np.flatnonzero(~np.isnan(values))
+        if len(pos) <= n_out:
+            keep.update(pos.tolist())
+            continue
+        vals = values[pos]
+        edges = np.linspace(0, len(pos), n_buckets + 1).astype(int)
+        for lo, hi in zip(edges[:-1], edges[1:]):
+            if hi <= lo:
+                continue
+            chunk = vals[lo:hi]
+            keep.add(pos[lo + int(np.argmin(chunk))])
+            keep.add(pos[lo + int(np.argmax(chunk))])
+        keep.update((pos[0], pos[-1]))
+    return df.iloc[sorted(keep)]
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=64)
+def build_views(
+    _fred: "Fred",
+    series_ids: Tuple[str, ...],
+    series_labels: Tuple[str, ...],
+    start: date,
+    end: date,
+    units: str,
+    frequency: str,
+    aggregation_method: str,
+) -> Tuple[pd.DataFrame, dict, pd.DataFrame, dict]:
+    # Derives everything from the fetch parameters, so unrelated reruns skip px.line, describe and CSV encoding
+    df = fetch_series(
+        _fred,
+        series_ids=tuple(sorted(series_ids)),
+        start=start,
+        end=end,
+        units=units,
+        frequency=frequency,
+        aggregation_method=aggregation_method,
+    )
+    # The sorted tuple only canonicalizes fetch_series' cache key; show series in pick order
+    df_named = df[list(series_ids)].set_axis(list(series_labels), axis=1)
+    if df_named.empty:
+        return df_named, {}, pd.DataFrame(), {}
+
+    import plotly.express as px
+
+    df_plot = downsample_for_plot(df_named)
+    fig = px.line(df_plot, x=df_plot.index, y=df_plot.columns, labels={"x": "Date", "value": "Value", "variable": "Series"})
+    fig.update_layout(legend_title_text="Series", hovermode="x unified")
+
+    buf = io.BytesIO()
+    df_named.to_csv(buf, index=True, encoding="utf-8")
+    csv = buf.getvalue()
+    if len(csv) > GZIP_THRESHOLD_BYTES:
+        download = dict(
+            label="Download CSV (gz)",
+            data=gzip.compress(csv, compresslevel=1),
+            file_name="fred_data.csv.gz",
+            mime="application/gzip",
+        )
+    else:
+        download = dict(label="Download CSV", data=csv, file_name="fred_data.csv", mime="text/csv")
+    return df_named, fig.to_dict(), df_named.describe().T, download
+
 # -------------- UI -------------- #
 st.set_page_config(page_title=APP_TITLE, layout="wide")
 st.title(APP_TITLE)
@@ -155,7 +330,7 @@ with st.sidebar:
         type="password",
         help="Store in env var FRED_API_KEY or paste here.",
     )
-    if Fred is None:
+    if not FREDAPI_AVAILABLE:
         st.error("fredapi is not installed. Run: pip install fredapi")
     elif not api_key:
         st.info("Enter your FRED API key to begin.")
@@ -181,19 +356,26 @@ with col1:
 
     results_df = pd.DataFrame()
     fred_client = None
-    if api_key and Fred is not None:
+    if api_key and FREDAPI_AVAILABLE:
         try:
             fred_client = get_fred(api_key)
         except Exception as e:
             st.error(f"Could not connect to FRED: {e}")
 
+    # Reuse the last results while key/query/limit are unchanged so unrelated reruns skip the search;
+    # clicking Search always re-queries
+    search_key = (api_key_fingerprint(api_key), query, limit)
+    search_cache = st.session_state.get("search_cache")
     if do_search and fred_client is not None:
         try:
             results_df = fred_search(fred_client, api_key, query, limit)
+            st.session_state["search_cache"] = {"key": search_key, "df": results_df}
             if results_df.empty:
                 st.warning("No results. Try different keywords.")
         except Exception as e:
             st.error(f"Search failed: {e}")
+    elif fred_client is not None and search_cache is not None and search_cache["key"] == search_key:
+        results_df = search_cache["df"]
 
     if not results_df.empty:
         st.dataframe(results_df, use_container_width=True, hide_index=True)
@@ -201,9 +383,10 @@ with col1:
 with col2:
     st.subheader("Pick series to plot")
     if not results_df.empty:
-        options = results_df[["id", "title"]].apply(lambda r: f"{r['id']} — {r['title']}", axis=1).tolist()
-        selection = st.multiselect("Results", options=options, help="Select one or more series to add to the chart")
-        chosen_ids = [opt.split(" — ")[0] for opt in selection]
+        labels = results_df["id"].astype(str) + " — " + results_df["title"].astype(str)
+        option_ids = dict(zip(labels.tolist(), results_df["id"].tolist()))
+        selection = st.multiselect("Results", options=list(option_ids), help="Select one or more series to add to the chart")
+        chosen_ids = [option_ids[opt] for opt in selection]
     else:
         chosen_text = st.text_input("Series IDs (comma-separated)", placeholder="CPIAUCSL, UNRATE")
         chosen_ids = [s.strip() for s in chosen_text.split(",") if s.strip()]
@@ -211,9 +394,20 @@ with col2:
     st.caption("Tip: You can combine search selection with manual IDs. Duplicate IDs are deduped.")
 
     manual_add = st.text_input("Add series ID", placeholder="e.g., DGS10")
-    add_clicked = st.button("Add", use_container_width=True)
+    add_col, clear_col = st.columns([1, 1])
+    add_clicked = add_col.button("Add", use_container_width=True)
+    clear_clicked = clear_col.button("Clear added", use_container_width=True)
+
+    # Manual adds persist in session state; picks already persist through their widgets
+    manual = st.session_state.setdefault("manual", {})
+    if clear_clicked:
+        manual.clear()
     if add_clicked and manual_add:
-        chosen_ids = list(dict.fromkeys(chosen_ids + [manual_add.strip()]))
+        manual[manual_add.strip()] = None
+    # Ordered dict doubles as a dedupe set: picks first, then manual adds
+    chosen = dict.fromkeys(chosen_ids)
+    chosen.update(manual)
+    chosen_ids = tuple(chosen)
 
     if chosen_ids:
         st.write("**Selected series:**", ", ".join(chosen_ids))
@@ -223,42 +417,34 @@ st.markdown("---")
 # Fetch & plot
 if chosen_ids and fred_client is not None:
     try:
-        df = fetch_series(
+        def series_label(sid: str) -> str:
+            try:
+                return f"{sid}: {get_series_title(fred_client, sid)}"
+            except Exception:
+                return sid
+
+        with ThreadPoolExecutor(max_workers=min(8, len(chosen_ids))) as ex:
+            labels = tuple(ex.map(series_label, chosen_ids))
+
+        df_named, fig, stats, download = build_views(
             fred_client,
-            series_ids=list(dict.fromkeys(chosen_ids)),
+            series_ids=chosen_ids,
+            series_labels=labels,
             start=start_date,
             end=end_date,
             units=units_key,
             frequency=freq_key,
             aggregation_method=agg_key,
         )
-        if df.empty:
+        if df_named.empty:
             st.warning("No observations for the selected range.")
         else:
-            names = {}
-            try:
-                for sid in df.columns:
-                    info = fred_client.get_series_info(sid)
-                    names[sid] = f"{sid}: {info.title}" if hasattr(info, "title") else sid
-            except Exception:
-                names = {sid: sid for sid in df.columns}
-
-            df_named = df.rename(columns=names)
-            fig = px.line(df_named, x=df_named.index, y=df_named.columns, labels={"x": "Date", "value": "Value", "variable": "Series"})
-            fig.update_layout(legend_title_text="Series", hovermode="x unified")
             st.plotly_chart(fig, use_container_width=True)
 
             with st.expander("Summary stats"):
-                st.dataframe(df_named.describe().T, use_container_width=True)
-
-            csv = df_named.to_csv(index=True).encode("utf-8")
-            st.download_button(
-                label="Download CSV",
-                data=csv,
-                file_name="fred_data.csv",
-                mime="text/csv",
-                use_container_width=True,
-            )
+                st.dataframe(stats, use_container_width=True)
+
+            st.download_button(**download, use_container_width=True)
     except Exception as e:
         st.error(f"Data fetch/plot failed: {e}")
 else: